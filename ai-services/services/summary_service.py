@@ -7,25 +7,51 @@ extracting key points, decisions, action items, and insights.
 """
 
 import asyncio
-import json
+import bisect
+import copy
+import hashlib
+import itertools
 import logging
 import re
+import threading
 import time
-from typing import Dict, List, Optional, Any, Tuple
-from dataclasses import dataclass, asdict
-from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterator, List, Optional, Any, Set, Tuple
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
 
+import ahocorasick
+import httpx
 import openai
+import orjson
 from transformers import pipeline, AutoTokenizer, AutoModelForSeq2SeqLM
 import spacy
-from textstat import flesch_reading_ease, syllable_count
+from spacy.tokens import Doc, Span
 import nltk
 from nltk.corpus import stopwords
-from nltk.tokenize import sent_tokenize, word_tokenize
-from nltk.tag import pos_tag
 from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.cluster import KMeans
+from sklearn.cluster import KMeans, MiniBatchKMeans
 import numpy as np
+import torch
+
+try:
+    # Linear-time RE2 engine for the extraction patterns, when installed
+    import re2 as _extraction_re
+except ImportError:
+    _extraction_re = re
+
+try:
+    # Compresses cached summaries, when installed
+    import zstandard
+except ImportError:
+    zstandard = None
+
+try:
+    # HTTP/2 for the OpenAI connection pool, when installed
+    import h2  # noqa: F401
+    _HTTP2_AVAILABLE = True
+except ImportError:
+    _HTTP2_AVAILABLE = False
 
 from core.config import settings
 from services.redis_service import RedisService
@@ -33,11 +59,325 @@ from services.kafka_service import KafkaService
 from utils.text_processing import TextProcessor
 from utils.metrics import track_performance, increment_counter
 
+# ===================================
+# SERIALIZATION
+# ===================================
+
+# orjson encodes the summary dataclasses, numpy scalars and the UTC
+# datetime natively, without building an intermediate dict
+_ORJSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_UTC_Z
+
+# Bump whenever the cached MeetingSummary layout or its generation changes
+SUMMARY_SCHEMA_VERSION = 2
+
+# Cached summaries start with one format byte so readers can tell a zstd
+# frame from raw JSON, whichever the writer had available
+_CACHE_FORMAT_RAW = b"\x00"
+_CACHE_FORMAT_ZSTD = b"\x01"
+CACHE_ZSTD_LEVEL = 3
+
+if zstandard is not None:
+    # Only used from the event loop thread, so one instance of each is enough
+    _ZSTD_COMPRESSOR = zstandard.ZstdCompressor(level=CACHE_ZSTD_LEVEL)
+    _ZSTD_DECOMPRESSOR = zstandard.ZstdDecompressor()
+
+def _pack_cache_payload(data: bytes) -> bytes:
+    """Prefix encoded JSON with its format byte, compressing it when possible."""
+    if zstandard is None:
+        return _CACHE_FORMAT_RAW + data
+    return _CACHE_FORMAT_ZSTD + _ZSTD_COMPRESSOR.compress(data)
+
+def _unpack_cache_payload(payload: bytes) -> bytes:
+    """Return the JSON bytes of a payload written by _pack_cache_payload."""
+    fmt, body = payload[:1], payload[1:]
+    if fmt == _CACHE_FORMAT_ZSTD:
+        if zstandard is None:
+            raise ValueError("zstd-compressed cache entry but zstandard is not installed")
+        return _ZSTD_DECOMPRESSOR.decompress(body)
+    if fmt == _CACHE_FORMAT_RAW:
+        return body
+    raise ValueError(f"Unknown cache payload format {fmt!r}")
+
+# ===================================
+# PATTERNS
+# ===================================
+
+# Action and decision patterns run over the whole transcript, so they are
+# compiled with RE2 when available; case-insensitivity is an inline flag
+# because RE2 does not take re's flag bits.
+_ACTION_PATTERNS = tuple(_extraction_re.compile("(?i)" + p) for p in (
+    r"(?:will|should|need to|must|have to)\s+(.+?)(?:\.|$)",
+    r"action item[:\s]+(.+?)(?:\.|$)",
+    r"(?:assigned to|@)(\w+)",
+    r"by\s+(\w+day|\d{1,2}[\/\-]\d{1,2}|\w+\s+\d{1,2})",
+))
+_DECISION_PATTERNS = tuple(_extraction_re.compile("(?i)" + p) for p in (
+    r"(?:decided|agreed|concluded|determined)\s+(?:that\s+)?(.+?)(?:\.|$)",
+    r"decision[:\s]+(.+?)(?:\.|$)",
+    r"we\s+(?:will|are going to|have decided to)\s+(.+?)(?:\.|$)",
+))
+# Patterns like "Sarah will", "@Sarah", "assigned to Sarah"
+_ASSIGNEE_PATTERNS = tuple(re.compile(p, re.IGNORECASE) for p in (
+    r'([A-Z][a-z]+)\s+will',
+    r'@([A-Z][a-z]+)',
+    r'assigned to ([A-Z][a-z]+)',
+))
+_DUE_DATE_PATTERNS = tuple(re.compile(p, re.IGNORECASE) for p in (
+    r'by (\w+day)',
+    r'by (\w+ \d{1,2})',
+    r'(\d{1,2}/\d{1,2})',
+    r'(\d{1,2}-\d{1,2})',
+))
+# Speaker turns in "Name:" format
+_SPEAKER_RE = re.compile(r'([A-Z][a-z]+):')
+# Sentence ends used to break up transcript lines too long for one spaCy window
+_SENTENCE_END_RE = re.compile(r'(?<=[.!?])\s+')
+
+def _keyword_re(*keywords: str) -> "re.Pattern[str]":
+    """Compile keywords into one alternation that matches any as a substring."""
+    return re.compile("|".join(map(re.escape, keywords)))
+
+# Keyword tables for classification, checked in order against lowercased text
+_SENTENCE_CATEGORIES = (
+    (_keyword_re('?', 'what', 'how', 'why', 'when', 'where'), 'question'),
+    (_keyword_re('decision', 'decided', 'agreed'), 'decision'),
+    (_keyword_re('action', 'will', 'should', 'need to'), 'action'),
+    (_keyword_re('announce', 'announcement', 'news'), 'announcement'),
+)
+_ACTION_PRIORITIES = (
+    (_keyword_re('urgent', 'asap', 'immediately', 'critical'), 'high'),
+    (_keyword_re('important', 'priority', 'soon'), 'medium'),
+)
+_ACTION_CATEGORIES = (
+    (_keyword_re('document', 'write', 'create', 'draft'), 'documentation'),
+    (_keyword_re('test', 'verify', 'check', 'validate'), 'testing'),
+    (_keyword_re('review', 'analyze', 'examine'), 'review'),
+    (_keyword_re('meeting', 'schedule', 'call'), 'meeting'),
+    (_keyword_re('fix', 'resolve', 'debug', 'troubleshoot'), 'bug_fix'),
+)
+
+def _classify(text_lower: str, table: Tuple[Tuple["re.Pattern[str]", str], ...], default: str) -> str:
+    """Return the label of the first table entry whose keywords occur in text."""
+    for pattern, label in table:
+        if pattern.search(text_lower):
+            return label
+    return default
+
+# Simple keyword-based sentiment vocabulary
+_POSITIVE_WORDS = ('good', 'great', 'excellent', 'success', 'agree', 'happy', 'positive')
+_NEGATIVE_WORDS = ('problem', 'issue', 'concern', 'difficult', 'challenge', 'disagree')
+
+# Each sentiment word owns one bit, so the words present in several texts
+# combine with a bitwise OR and are counted with a popcount
+_POSITIVE_MASK = (1 << len(_POSITIVE_WORDS)) - 1
+_NEGATIVE_MASK = ((1 << len(_NEGATIVE_WORDS)) - 1) << len(_POSITIVE_WORDS)
+
+def _build_sentiment_automaton() -> ahocorasick.Automaton:
+    """Build one automaton that finds every sentiment word in a single pass."""
+    automaton = ahocorasick.Automaton()
+    for bit, word in enumerate(_POSITIVE_WORDS + _NEGATIVE_WORDS):
+        automaton.add_word(word, 1 << bit)
+    automaton.make_automaton()
+    return automaton
+
+_SENTIMENT_AUTOMATON = _build_sentiment_automaton()
+
+def _sentiment_mask(text: str) -> int:
+    """Return the bitmask of sentiment words occurring in text."""
+    mask = 0
+    for _, bit in _SENTIMENT_AUTOMATON.iter(text.lower()):
+        mask |= bit
+    return mask
+
+def _sentiment_label(mask: int) -> str:
+    """Label a sentiment bitmask by its distinct positive/negative words."""
+    positive_count = (mask & _POSITIVE_MASK).bit_count()
+    negative_count = (mask & _NEGATIVE_MASK).bit_count()
+    
+    if positive_count > negative_count + 2:
+        return 'positive'
+    elif negative_count > positive_count + 2:
+        return 'negative'
+    else:
+        return 'neutral'
+
+# Summary confidence by transcript word count: below 50, 200, 500, and above
+_WC_THRESHOLDS = (50, 200, 500)
+_WC_SCORES = (0.3, 0.6, 0.8, 0.9)
+
+# ===================================
+# SHARED MODELS
+# ===================================
+
+SPACY_MODEL = "en_core_web_sm"
+# Only transformer pipelines (e.g. en_core_web_trf) gain much from the GPU
+SPACY_USE_GPU = False
+SUMMARY_BATCH_SIZE = 8
+SUMMARY_MAX_INPUT_TOKENS = 1024  # BART limit
+SUMMARY_WINDOW_TOKENS = 512
+SUMMARY_WINDOW_OVERLAP = 64
+# "torch", or "onnx-int8" to run a dynamically quantized ONNX export on CPU
+SUMMARY_BACKEND = "torch"
+# Dynamically quantize the torch model's Linear layers to int8 on CPU
+SUMMARY_QUANTIZE_CPU = True
+
+# Static instructions live in the system message so the provider can reuse
+# the cached prompt prefix across meetings; only meeting details vary
+SUMMARY_SYSTEM_PROMPT = (
+    "You are an expert meeting summarizer. Provide clear, concise, and actionable summaries.\n"
+    "\n"
+    "When given a meeting transcript, write a concise executive summary that includes:\n"
+    "1. Main topics discussed\n"
+    "2. Key outcomes\n"
+    "3. Overall meeting effectiveness\n"
+    "\n"
+    "Keep the summary to 2-3 paragraphs."
+)
+
+LOCAL_SUMMARY_UNAVAILABLE = "Meeting summary unavailable due to processing limitations."
+EXECUTIVE_SUMMARY_ERROR = "Unable to generate summary due to processing error."
+
+# Extractors run by generate_meeting_summary, in gather order: the failure
+# label to log and the value that stands in for a failed extractor
+_EXTRACTORS = (
+    ("extracting key points", []),
+    ("extracting decisions", []),
+    ("extracting action items", []),
+    ("analyzing topics", []),
+    ("analyzing overall sentiment", "neutral"),
+)
+SPACY_BATCH_SIZE = 64
+SPACY_WINDOW_TOKENS = 1000
+# Topic clustering switches to mini-batches above this many sentences
+TOPIC_MINIBATCH_MIN_SENTENCES = 200
+# Threads running model inference; more only thrash a single model instance
+MODEL_WORKER_THREADS = 2
+# Concurrent OpenAI requests per SummaryService instance
+OPENAI_CONCURRENCY = 8
+OPENAI_MAX_RETRIES = 2
+OPENAI_MAX_KEEPALIVE_CONNECTIONS = 64
+OPENAI_MAX_CONNECTIONS = 128
+
+# Finalized summaries are published and cached by a background sink; a full
+# queue makes producers wait, and each drain handles up to a batch at once
+SINK_QUEUE_SIZE = 1024
+SINK_BATCH_SIZE = 64
+
+# Models are loaded once per process and shared by every SummaryService
+# instance; deserializing them is far more expensive than running them.
+_NLP = None
+_SUMMARIZER = None
+_SUMMARIZER_TOK = None
+_STOP_WORDS: Optional[frozenset] = None
+_MODEL_LOCK = threading.Lock()
+# Serializes tokenize + generate on the shared summarizer across threads
+_SUMMARIZER_LOCK = threading.Lock()
+
+def _load_stop_words() -> frozenset:
+    """Return the shared English stop word set, downloading it on cold start."""
+    global _STOP_WORDS
+    if _STOP_WORDS is None:
+        try:
+            words = stopwords.words('english')
+        except LookupError:
+            nltk.download('stopwords', quiet=True)
+            words = stopwords.words('english')
+        _STOP_WORDS = frozenset(words)
+    return _STOP_WORDS
+
+def _load_nlp():
+    """Return the shared spaCy pipeline (tokenization + sentence segmentation only)."""
+    global _NLP
+    with _MODEL_LOCK:
+        if _NLP is None:
+            if SPACY_USE_GPU:
+                spacy.require_gpu()
+            # Only sentences and tokens are consumed; don't load the rest
+            excluded = ["parser", "tagger", "attribute_ruler", "lemmatizer", "ner"]
+            try:
+                nlp = spacy.load(SPACY_MODEL, exclude=excluded)
+            except OSError:
+                logging.getLogger(__name__).warning("spaCy model not found, downloading...")
+                spacy.cli.download(SPACY_MODEL)
+                nlp = spacy.load(SPACY_MODEL, exclude=excluded)
+            # The parser is off, so sentence boundaries come from senter
+            nlp.enable_pipe("senter")
+            # With its listeners excluded, tok2vec would embed every doc for
+            # nothing; senter keeps its own embedding in the small models
+            if "tok2vec" in nlp.pipe_names and not nlp.get_pipe("tok2vec").listeners:
+                nlp.remove_pipe("tok2vec")
+            _NLP = nlp
+        return _NLP
+
+def _load_onnx_int8_model():
+    """Load the int8 ONNX export of the summarization model.
+
+    The export is produced once, offline::
+
+        optimum-cli export onnx --model $SUMMARIZATION_MODEL $MODEL_CACHE_DIR/onnx
+        optimum-cli onnxruntime quantize --avx512_vnni \\
+            --onnx_model $MODEL_CACHE_DIR/onnx -o $MODEL_CACHE_DIR/onnx-int8
+    """
+    from optimum.onnxruntime import ORTModelForSeq2SeqLM
+    
+    return ORTModelForSeq2SeqLM.from_pretrained(
+        str(settings.MODEL_CACHE_DIR / "onnx-int8"),
+        encoder_file_name="encoder_model_quantized.onnx",
+        decoder_file_name="decoder_model_quantized.onnx",
+        decoder_with_past_file_name="decoder_with_past_model_quantized.onnx"
+    )
+
+def _load_summarizer():
+    """Return the shared summarization pipeline and its tokenizer."""
+    global _SUMMARIZER, _SUMMARIZER_TOK
+    with _MODEL_LOCK:
+        if _SUMMARIZER is None:
+            tokenizer = AutoTokenizer.from_pretrained(
+                settings.SUMMARIZATION_MODEL,
+                cache_dir=str(settings.MODEL_CACHE_DIR),
+                use_fast=True
+            )
+            if SUMMARY_BACKEND == "onnx-int8":
+                use_cuda = False
+                model = _load_onnx_int8_model()
+            else:
+                use_cuda = torch.cuda.is_available()
+                if use_cuda:
+                    dtype = torch.bfloat16 if torch.cuda.is_bf16_supported() else torch.float16
+                else:
+                    dtype = torch.float32
+                model = AutoModelForSeq2SeqLM.from_pretrained(
+                    settings.SUMMARIZATION_MODEL,
+                    cache_dir=str(settings.MODEL_CACHE_DIR),
+                    torch_dtype=dtype,
+                    # Fused scaled-dot-product attention kernels
+                    attn_implementation="sdpa"
+                )
+                if use_cuda:
+                    model = model.to("cuda")
+                elif SUMMARY_QUANTIZE_CPU:
+                    model = torch.quantization.quantize_dynamic(
+                        model, {torch.nn.Linear}, dtype=torch.qint8
+                    )
+                model.eval()
+            _SUMMARIZER = pipeline(
+                "summarization",
+                model=model,
+                tokenizer=tokenizer,
+                device=0 if use_cuda else -1,
+                batch_size=SUMMARY_BATCH_SIZE,
+                max_length=settings.SUMMARY_TARGET_LENGTH,
+                min_length=50,
+                do_sample=False
+            )
+            _SUMMARIZER_TOK = tokenizer
+        return _SUMMARIZER, _SUMMARIZER_TOK
+
 # ===================================
 # DATA CLASSES
 # ===================================
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ActionItem:
     """Represents an action item extracted from the meeting."""
     description: str
@@ -47,7 +387,7 @@ class ActionItem:
     category: Optional[str] = None
     confidence: float = 0.0
 
-@dataclass
+@dataclass(slots=True)
 class Decision:
     """Represents a decision made during the meeting."""
     description: str
@@ -56,16 +396,16 @@ class Decision:
     timestamp: Optional[float] = None
     confidence: float = 0.0
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class KeyPoint:
     """Represents a key point from the meeting."""
     text: str
     category: str  # discussion, announcement, question, etc.
     importance: float = 0.0
-    speakers: List[str] = None
+    speakers: List[str] = field(default_factory=list)
     timestamp: Optional[float] = None
 
-@dataclass
+@dataclass(slots=True)
 class TopicAnalysis:
     """Represents topic analysis of the meeting."""
     topic: str
@@ -75,7 +415,7 @@ class TopicAnalysis:
     sentiment: str = "neutral"
     importance: float = 0.0
 
-@dataclass
+@dataclass(slots=True)
 class MeetingSummary:
     """Complete meeting summary."""
     meeting_id: str
@@ -99,6 +439,32 @@ class MeetingSummary:
     generated_at: datetime
     confidence: float
     language: str = "en"
+    
+    # Encoded cache payload, filled once by SummaryService._serialize_summary;
+    # orjson skips underscore fields so it never ends up in its own payload
+    _cached_payload: Optional[bytes] = field(default=None, init=False, repr=False, compare=False)
+    # False when a model or extractor failed and fallbacks stand in for its output
+    _cacheable: bool = field(default=True, init=False, repr=False, compare=False)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "MeetingSummary":
+        return cls(
+            meeting_id=data["meeting_id"],
+            title=data["title"],
+            duration=data["duration"],
+            participant_count=data["participant_count"],
+            executive_summary=data["executive_summary"],
+            key_points=[KeyPoint(**key_point) for key_point in data["key_points"]],
+            decisions=[Decision(**decision) for decision in data["decisions"]],
+            action_items=[ActionItem(**action) for action in data["action_items"]],
+            topics=[TopicAnalysis(**topic) for topic in data["topics"]],
+            overall_sentiment=data["overall_sentiment"],
+            engagement_level=data["engagement_level"],
+            productivity_score=data["productivity_score"],
+            generated_at=datetime.fromisoformat(data["generated_at"]),
+            confidence=data["confidence"],
+            language=data["language"],
+        )
 
 # ===================================
 # SUMMARY SERVICE
@@ -107,6 +473,12 @@ class MeetingSummary:
 class SummaryService:
     """Main summary generation service."""
     
+    # Words that make a sentence more likely to be a key point
+    important_words = frozenset({
+        'decision', 'action', 'important', 'critical', 'urgent',
+        'deadline', 'priority', 'goal', 'objective', 'result'
+    })
+    
     def __init__(self):
         self.logger = logging.getLogger(__name__)
         self.redis: Optional[RedisService] = None
@@ -118,20 +490,23 @@ class SummaryService:
         self.tokenizer = None
         self.nlp = None
         self.text_processor = TextProcessor()
+        self._openai_semaphore = asyncio.Semaphore(OPENAI_CONCURRENCY)
+        self._model_executor: Optional[ThreadPoolExecutor] = None
+        self._sink_queue: "asyncio.Queue[MeetingSummary]" = asyncio.Queue(maxsize=SINK_QUEUE_SIZE)
+        self._sink_task: Optional[asyncio.Task] = None
+        
+        # Per-summary key formats and settings, resolved once
+        self._summary_cache_key = (
+            f"summary:{{}}:{settings.SUMMARIZATION_MODEL}:{SUMMARY_SCHEMA_VERSION}".format
+        )
+        self._summary_id = "summary_{}".format
+        self._cache_ttl = settings.CACHE_TTL_SUMMARY
+        self._summary_topic = settings.KAFKA_TOPIC_SUMMARY
         
         # Stop words and patterns
-        self.stop_words = set(stopwords.words('english'))
-        self.action_patterns = [
-            r"(?:will|should|need to|must|have to)\s+(.+?)(?:\.|$)",
-            r"action item[:\s]+(.+?)(?:\.|$)",
-            r"(?:assigned to|@)(\w+)",
-            r"by\s+(\w+day|\d{1,2}[\/\-]\d{1,2}|\w+\s+\d{1,2})"
-        ]
-        self.decision_patterns = [
-            r"(?:decided|agreed|concluded|determined)\s+(?:that\s+)?(.+?)(?:\.|$)",
-            r"decision[:\s]+(.+?)(?:\.|$)",
-            r"we\s+(?:will|are going to|have decided to)\s+(.+?)(?:\.|$)"
-        ]
+        self.stop_words = _load_stop_words()
+        self.action_patterns = _ACTION_PATTERNS
+        self.decision_patterns = _DECISION_PATTERNS
         
         # Performance tracking
         self.performance_metrics = {
@@ -140,6 +515,15 @@ class SummaryService:
             "average_processing_time": 0,
             "error_count": 0,
         }
+        self._refresh_static_health()
+
+    def _refresh_static_health(self) -> None:
+        """Snapshot the health fields that only change during initialization."""
+        self._static_health = {
+            "openai_available": self.openai_client is not None,
+            "summarization_model_loaded": self.summarization_model is not None,
+            "nlp_model_loaded": self.nlp is not None,
+        }
 
     async def initialize(self) -> None:
         """Initialize the summary service."""
@@ -150,11 +534,29 @@ class SummaryService:
             self.redis = RedisService()
             self.kafka = KafkaService()
             
+            # Dedicated, bounded pool for model loading and inference
+            self._model_executor = ThreadPoolExecutor(
+                max_workers=MODEL_WORKER_THREADS,
+                thread_name_prefix='summary-model'
+            )
+            
             # Initialize OpenAI client
             if settings.OPENAI_API_KEY:
                 self.openai_client = openai.AsyncOpenAI(
                     api_key=settings.OPENAI_API_KEY,
-                    timeout=settings.OPENAI_REQUEST_TIMEOUT
+                    timeout=settings.OPENAI_REQUEST_TIMEOUT,
+                    # Retries back off exponentially on 429/5xx only
+                    max_retries=OPENAI_MAX_RETRIES,
+                    # Keep-alive pool shared by concurrent summaries, on the
+                    # SDK's client defaults; HTTP/2 only when h2 is installed
+                    http_client=openai.DefaultAsyncHttpxClient(
+                        http2=_HTTP2_AVAILABLE,
+                        limits=httpx.Limits(
+                            max_keepalive_connections=OPENAI_MAX_KEEPALIVE_CONNECTIONS,
+                            max_connections=OPENAI_MAX_CONNECTIONS
+                        ),
+                        timeout=settings.OPENAI_REQUEST_TIMEOUT
+                    )
                 )
             
             # Load summarization model
@@ -166,107 +568,114 @@ class SummaryService:
             # Download NLTK data
             await self._setup_nltk()
             
+            # Publish and cache finished summaries off the request path; started
+            # last so a failed initialization leaves no orphaned task behind
+            self._sink_task = asyncio.create_task(self._sink_loop())
+            
             self.logger.info("✅ Summary Service initialized successfully")
             
         except Exception as e:
-            self.logger.error(f"❌ Failed to initialize Summary Service: {e}")
+            self.logger.error("❌ Failed to initialize Summary Service: %s", e)
             raise
+        
+        finally:
+            self._refresh_static_health()
 
     async def _load_summarization_model(self) -> None:
         """Load the summarization model."""
-        def load_model():
-            tokenizer = AutoTokenizer.from_pretrained(
-                settings.SUMMARIZATION_MODEL,
-                cache_dir=str(settings.MODEL_CACHE_DIR)
-            )
-            model = AutoModelForSeq2SeqLM.from_pretrained(
-                settings.SUMMARIZATION_MODEL,
-                cache_dir=str(settings.MODEL_CACHE_DIR)
-            )
-            
-            summarizer = pipeline(
-                "summarization",
-                model=model,
-                tokenizer=tokenizer,
-                max_length=settings.SUMMARY_TARGET_LENGTH,
-                min_length=50,
-                do_sample=False
-            )
-            return summarizer, tokenizer
-        
         self.summarization_model, self.tokenizer = await asyncio.get_event_loop().run_in_executor(
-            None, load_model
+            self._model_executor, _load_summarizer
         )
-        self.logger.info(f"✅ Summarization model '{settings.SUMMARIZATION_MODEL}' loaded")
+        self.logger.info("✅ Summarization model '%s' loaded", settings.SUMMARIZATION_MODEL)
 
     async def _load_nlp_model(self) -> None:
         """Load spaCy NLP model."""
-        def load_spacy():
-            try:
-                return spacy.load("en_core_web_sm")
-            except OSError:
-                self.logger.warning("spaCy model not found, downloading...")
-                spacy.cli.download("en_core_web_sm")
-                return spacy.load("en_core_web_sm")
-        
         self.nlp = await asyncio.get_event_loop().run_in_executor(
-            None, load_spacy
+            self._model_executor, _load_nlp
         )
         self.logger.info("✅ spaCy NLP model loaded")
 
     async def _setup_nltk(self) -> None:
         """Setup NLTK data."""
-        def download_nltk_data():
-            try:
-                nltk.data.find('tokenizers/punkt')
-                nltk.data.find('corpora/stopwords')
-                nltk.data.find('taggers/averaged_perceptron_tagger')
-            except LookupError:
-                nltk.download('punkt', quiet=True)
-                nltk.download('stopwords', quiet=True)
-                nltk.download('averaged_perceptron_tagger', quiet=True)
-        
+        # Tokenization comes from spaCy; NLTK only provides stop words
         await asyncio.get_event_loop().run_in_executor(
-            None, download_nltk_data
+            self._model_executor, _load_stop_words
         )
         self.logger.info("✅ NLTK data ready")
 
     async def generate_meeting_summary(self, meeting_id: str) -> Optional[MeetingSummary]:
         """Generate a comprehensive summary for a meeting."""
         try:
-            start_time = time.time()
-            self.logger.info(f"Generating summary for meeting {meeting_id}")
+            start_ns = time.monotonic_ns()
+            
+            # Retries, webhook replays and dashboard refreshes hit the cache
+            cached = await self._get_cached_summary(meeting_id)
+            if cached:
+                increment_counter("summary_cache_hits")
+                return cached
+            
+            self.logger.info("Generating summary for meeting %s", meeting_id)
             
             # Get meeting data and transcription
             meeting_data = await self._get_meeting_data(meeting_id)
             if not meeting_data:
-                self.logger.warning(f"No meeting data found for {meeting_id}")
+                self.logger.warning("No meeting data found for %s", meeting_id)
                 return None
             
             transcription_text = await self._get_transcription_text(meeting_id)
             if not transcription_text or len(transcription_text.strip()) < 100:
-                self.logger.warning(f"Insufficient transcription data for {meeting_id}")
+                self.logger.warning("Insufficient transcription data for %s", meeting_id)
                 return None
             
             # Check minimum meeting duration
             if meeting_data.get('duration', 0) < settings.SUMMARY_MIN_MEETING_DURATION:
-                self.logger.info(f"Meeting {meeting_id} too short for summary generation")
+                self.logger.info("Meeting %s too short for summary generation", meeting_id)
                 return None
             
             # Preprocess text
             processed_text = await self.text_processor.preprocess(transcription_text)
             
-            # Generate different components
-            executive_summary = await self._generate_executive_summary(processed_text, meeting_data)
-            key_points = await self._extract_key_points(processed_text, meeting_data)
-            decisions = await self._extract_decisions(processed_text, meeting_data)
-            action_items = await self._extract_action_items(processed_text, meeting_data)
-            topics = await self._analyze_topics(processed_text, meeting_data)
+            # Start the executive summary first: its OpenAI round-trip or
+            # model inference overlaps with all of the local extraction below
+            executive_summary_task = asyncio.create_task(
+                self._generate_executive_summary(processed_text, meeting_data)
+            )
+            
+            try:
+                # Parse the transcript once and share the docs between extractors
+                docs = await asyncio.get_event_loop().run_in_executor(
+                    self._model_executor, self._parse_batch, self._split_windows(processed_text)
+                )
+                
+                # The extractors are independent and CPU-bound, so run them on
+                # worker threads instead of blocking the event loop one by one
+                results = await asyncio.gather(
+                    asyncio.to_thread(self._extract_key_points, docs, meeting_data),
+                    asyncio.to_thread(self._extract_decisions, processed_text, meeting_data),
+                    asyncio.to_thread(self._extract_action_items, processed_text, meeting_data),
+                    asyncio.to_thread(self._analyze_topics, docs, meeting_data),
+                    asyncio.to_thread(self._analyze_overall_sentiment, processed_text),
+                    return_exceptions=True
+                )
+            except BaseException:
+                executive_summary_task.cancel()
+                raise
+            
+            executive_summary, complete = await executive_summary_task
+            
+            # A failed extractor falls back to an empty result, and the partial
+            # summary is kept out of the cache so retries regenerate it
+            results = list(results)
+            for index, (label, default) in enumerate(_EXTRACTORS):
+                if isinstance(results[index], Exception):
+                    self.logger.error("Error %s: %s", label, results[index])
+                    results[index] = copy.copy(default)
+                    complete = False
+            key_points, decisions, action_items, topics, overall_sentiment = results
             
             # Calculate metrics
-            overall_sentiment = await self._analyze_overall_sentiment(processed_text)
-            engagement_level = await self._calculate_engagement_level(meeting_data)
-            productivity_score = await self._calculate_productivity_score(
+            engagement_level = self._calculate_engagement_level(meeting_data)
+            productivity_score = self._calculate_productivity_score(
                 len(decisions), len(action_items), len(key_points), meeting_data.get('duration', 0)
             )
             
@@ -284,22 +693,17 @@ class SummaryService:
                 overall_sentiment=overall_sentiment,
                 engagement_level=engagement_level,
                 productivity_score=productivity_score,
-                generated_at=datetime.utcnow(),
-                confidence=await self._calculate_summary_confidence(processed_text),
+                generated_at=datetime.now(timezone.utc),
+                confidence=self._calculate_summary_confidence(docs),
                 language="en"
             )
+            summary._cacheable = complete
             
-            # Save summary
-            await self._save_summary(summary)
-            
-            # Publish event
-            await self._publish_summary_event(summary)
-            
-            # Cache summary
-            await self._cache_summary(summary)
+            # Save, publish and cache the summary
+            await self._finalize_summary(summary)
             
             # Update metrics
-            processing_time = time.time() - start_time
+            processing_time = (time.monotonic_ns() - start_ns) / 1e9
             self.performance_metrics["summaries_generated"] += 1
             self.performance_metrics["total_processing_time"] += processing_time
             self.performance_metrics["average_processing_time"] = (
@@ -311,29 +715,37 @@ class SummaryService:
             increment_counter("summaries_generated")
             track_performance("summary_generation_time", processing_time)
             
-            self.logger.info(f"Summary generated for meeting {meeting_id} in {processing_time:.2f}s")
+            self.logger.info("Summary generated for meeting %s in %.2fs", meeting_id, processing_time)
             return summary
             
         except Exception as e:
-            self.logger.error(f"Error generating summary for meeting {meeting_id}: {e}")
+            self.logger.error("Error generating summary for meeting %s: %s", meeting_id, e)
             self.performance_metrics["error_count"] += 1
             increment_counter("summary_errors")
             return None
 
+    async def generate_meeting_summaries(self, meeting_ids: List[str]) -> List[Optional[MeetingSummary]]:
+        """Generate summaries for several meetings concurrently."""
+        # OpenAI round-trips overlap; the semaphore keeps them under the rate limit
+        return list(await asyncio.gather(
+            *(self.generate_meeting_summary(meeting_id) for meeting_id in meeting_ids)
+        ))
+
     async def _get_meeting_data(self, meeting_id: str) -> Optional[Dict[str, Any]]:
         """Get meeting metadata from database."""
         try:
             # This would integrate with your database layer
             # For now, we'll simulate the data
+            now = datetime.now(timezone.utc)
             return {
                 "title": "Team Meeting",
                 "duration": 3600,  # 1 hour
                 "participant_count": 5,
-                "start_time": datetime.utcnow() - timedelta(hours=1),
-                "end_time": datetime.utcnow(),
+                "start_time": now - timedelta(hours=1),
+                "end_time": now,
             }
         except Exception as e:
-            self.logger.error(f"Failed to get meeting data: {e}")
+            self.logger.error("Failed to get meeting data: %s", e)
             return None
 
     async def _get_transcription_text(self, meeting_id: str) -> Optional[str]:
@@ -353,401 +765,514 @@ class SummaryService:
             John: Alright, let's wrap up. Action items: Sarah documents auth flow, Mike tests the module, and I'll schedule the performance review meeting.
             """
         except Exception as e:
-            self.logger.error(f"Failed to get transcription: {e}")
+            self.logger.error("Failed to get transcription: %s", e)
             return None
 
-    async def _generate_executive_summary(self, text: str, meeting_data: Dict[str, Any]) -> str:
-        """Generate an executive summary using AI models."""
+    async def _generate_executive_summary(self, text: str, meeting_data: Dict[str, Any]) -> Tuple[str, bool]:
+        """Generate an executive summary, and whether a model actually produced it."""
         try:
+            # Re-runs of the same transcript reuse the previous summary; the
+            # key names the model that actually produced the cached text
+            content_hash = hashlib.sha256(
+                f"{meeting_data.get('title')}|{meeting_data.get('duration')}|"
+                f"{meeting_data.get('participant_count')}|{text}".encode()
+            ).hexdigest()[:24]
+            
             # Use OpenAI if available, otherwise use local model
             if self.openai_client and settings.OPENAI_API_KEY:
-                return await self._generate_openai_summary(text, meeting_data)
-            else:
-                return await self._generate_local_summary(text)
+                cache_key = f"sum:exec:{settings.OPENAI_MODEL}:{content_hash}"
+                cached = await self._get_cached_text(cache_key)
+                if cached:
+                    return cached, True
                 
-        except Exception as e:
-            self.logger.error(f"Error generating executive summary: {e}")
-            return "Unable to generate summary due to processing error."
-
-    async def _generate_openai_summary(self, text: str, meeting_data: Dict[str, Any]) -> str:
-        """Generate summary using OpenAI."""
-        try:
-            prompt = f"""
-            Please provide a concise executive summary of this meeting transcript.
-            
-            Meeting Details:
-            - Title: {meeting_data.get('title', 'Team Meeting')}
-            - Duration: {meeting_data.get('duration', 0) // 60} minutes
-            - Participants: {meeting_data.get('participant_count', 0)}
+                summary = await self._generate_openai_summary(text, meeting_data)
+                if summary is not None:
+                    await self._set_cached_text(cache_key, summary)
+                    return summary, True
             
-            Transcript:
-            {text[:settings.SUMMARY_MAX_INPUT_LENGTH]}
+            # Local model, either configured or as the fallback for a failed OpenAI call
+            cache_key = f"sum:exec:{settings.SUMMARIZATION_MODEL}:{content_hash}"
+            cached = await self._get_cached_text(cache_key)
+            if cached:
+                return cached, True
             
-            Please include:
-            1. Main topics discussed
-            2. Key outcomes
-            3. Overall meeting effectiveness
-            
-            Keep the summary to 2-3 paragraphs.
-            """
+            summary = await self._generate_local_summary(text)
+            if summary == LOCAL_SUMMARY_UNAVAILABLE:
+                return summary, False
             
-            response = await self.openai_client.chat.completions.create(
-                model=settings.OPENAI_MODEL,
-                messages=[
-                    {"role": "system", "content": "You are an expert meeting summarizer. Provide clear, concise, and actionable summaries."},
-                    {"role": "user", "content": prompt}
-                ],
-                max_tokens=settings.OPENAI_MAX_TOKENS,
-                temperature=settings.OPENAI_TEMPERATURE
+            await self._set_cached_text(cache_key, summary)
+            return summary, True
+                
+        except Exception as e:
+            self.logger.error("Error generating executive summary: %s", e)
+            return EXECUTIVE_SUMMARY_ERROR, False
+
+    async def _get_cached_text(self, cache_key: str) -> Optional[str]:
+        """Read a cached string from Redis."""
+        try:
+            if self.redis:
+                value = await self.redis.get(cache_key)
+                if isinstance(value, bytes):
+                    return value.decode()
+                return value
+        except Exception as e:
+            self.logger.error("Failed to read cache key %s: %s", cache_key, e)
+        return None
+
+    async def _set_cached_text(self, cache_key: str, value: str) -> None:
+        """Cache a string in Redis."""
+        try:
+            if self.redis:
+                await self.redis.setex(cache_key, self._cache_ttl, value)
+        except Exception as e:
+            self.logger.error("Failed to write cache key %s: %s", cache_key, e)
+
+    async def _generate_openai_summary(self, text: str, meeting_data: Dict[str, Any]) -> Optional[str]:
+        """Generate summary using OpenAI, or None if the request fails."""
+        try:
+            prompt = (
+                f"Title: {meeting_data.get('title', 'Team Meeting')}\n"
+                f"Duration: {meeting_data.get('duration', 0) // 60} minutes\n"
+                f"Participants: {meeting_data.get('participant_count', 0)}\n"
+                f"\n"
+                f"Transcript:\n"
+                f"{text[:settings.SUMMARY_MAX_INPUT_LENGTH]}"
             )
             
+            async with self._openai_semaphore:
+                response = await self.openai_client.chat.completions.create(
+                    model=settings.OPENAI_MODEL,
+                    messages=[
+                        {"role": "system", "content": SUMMARY_SYSTEM_PROMPT},
+                        {"role": "user", "content": prompt}
+                    ],
+                    max_tokens=settings.OPENAI_MAX_TOKENS,
+                    temperature=settings.OPENAI_TEMPERATURE
+                )
+            
             return response.choices[0].message.content.strip()
             
         except Exception as e:
-            self.logger.error(f"OpenAI summary generation failed: {e}")
-            # Fallback to local model
-            return await self._generate_local_summary(text)
+            self.logger.error("OpenAI summary generation failed: %s", e)
+            # The caller falls back to the local model
+            return None
+
+    def _summarize_batch(self, texts: List[str]) -> List[str]:
+        """Summarize several texts with one batched generate call."""
+        model = self.summarization_model.model
+        encoded = self.tokenizer(
+            texts,
+            padding=True,
+            truncation=True,
+            max_length=SUMMARY_MAX_INPUT_TOKENS,
+            return_tensors="pt"
+        ).to(model.device)
+        
+        with torch.inference_mode():
+            output = model.generate(
+                **encoded,
+                max_length=200,
+                min_length=50,
+                do_sample=False
+            )
+        
+        return self.tokenizer.batch_decode(output, skip_special_tokens=True)
+
+    def _encode(self, text: str) -> List[int]:
+        """Tokenize text for the summarizer, without special tokens."""
+        return self.tokenizer(text, add_special_tokens=False)["input_ids"]
+
+    def _windows(self, token_ids: List[int]) -> Iterator[str]:
+        """Yield overlapping windows of text sized in summarizer tokens."""
+        step = SUMMARY_WINDOW_TOKENS - SUMMARY_WINDOW_OVERLAP
+        
+        for start in range(0, max(len(token_ids) - SUMMARY_WINDOW_OVERLAP, 1), step):
+            yield self.tokenizer.decode(
+                token_ids[start:start + SUMMARY_WINDOW_TOKENS],
+                skip_special_tokens=True
+            )
+
+    def _summarize_windows(self, token_ids: List[int]) -> List[str]:
+        """Summarize every window of a token sequence, a batch at a time."""
+        partials = []
+        windows = self._windows(token_ids)
+        while batch := list(itertools.islice(windows, SUMMARY_BATCH_SIZE)):
+            partials.extend(self._summarize_batch(batch))
+        return partials
 
     async def _generate_local_summary(self, text: str) -> str:
         """Generate summary using local model."""
         def summarize():
-            try:
-                # Truncate text if too long
-                max_length = 1024  # BART limit
-                if len(text) > max_length:
-                    text_truncated = text[:max_length]
-                else:
-                    text_truncated = text
-                
-                summary = self.summarization_model(
-                    text_truncated,
-                    max_length=200,
-                    min_length=50,
-                    do_sample=False
-                )
-                
-                return summary[0]['summary_text']
-                
-            except Exception as e:
-                self.logger.error(f"Local summarization failed: {e}")
-                return "Meeting summary unavailable due to processing limitations."
+            # The shared fast tokenizer keeps truncation/padding state and raises
+            # "Already borrowed" when two threads reconfigure it at once
+            with _SUMMARIZER_LOCK:
+                try:
+                    input_limit = SUMMARY_MAX_INPUT_TOKENS - self.tokenizer.num_special_tokens_to_add()
+                    
+                    # Transcripts that fit in one input are summarized directly
+                    token_ids = self._encode(text)
+                    if len(token_ids) <= input_limit:
+                        return self._summarize_batch([text])[0]
+                    
+                    # Map: summarize each window
+                    partials = self._summarize_windows(token_ids)
+                    
+                    # Reduce: re-window the partial summaries until they fit in one
+                    # input, so the tokenizer never truncates the end of the meeting
+                    while len(partials) > 1:
+                        combined = " ".join(partials)
+                        token_ids = self._encode(combined)
+                        if len(token_ids) <= input_limit:
+                            return self._summarize_batch([combined])[0]
+                        partials = self._summarize_windows(token_ids)
+                    
+                    return partials[0]
+                    
+                except Exception as e:
+                    self.logger.error("Local summarization failed: %s", e)
+                    return LOCAL_SUMMARY_UNAVAILABLE
         
-        return await asyncio.get_event_loop().run_in_executor(None, summarize)
+        return await asyncio.get_event_loop().run_in_executor(self._model_executor, summarize)
 
-    async def _extract_key_points(self, text: str, meeting_data: Dict[str, Any]) -> List[KeyPoint]:
-        """Extract key points from the meeting transcript."""
-        try:
-            key_points = []
-            
-            # Split into sentences
-            sentences = sent_tokenize(text)
-            
-            # Score sentences for importance
-            sentence_scores = await self._score_sentences(sentences)
-            
-            # Select top sentences as key points
-            top_sentences = sorted(
-                zip(sentences, sentence_scores), 
-                key=lambda x: x[1], 
-                reverse=True
-            )[:10]  # Top 10 sentences
+    def _window_lines(self, text: str) -> Iterator[str]:
+        """Yield text's lines, breaking any longer than one window at sentence ends."""
+        for line in text.splitlines():
+            if len(line.split()) <= SPACY_WINDOW_TOKENS:
+                yield line
+                continue
             
-            for sentence, score in top_sentences:
-                if score > 0.3:  # Minimum threshold
-                    category = await self._categorize_sentence(sentence)
-                    speakers = await self._extract_speakers(sentence)
-                    
-                    key_points.append(KeyPoint(
-                        text=sentence.strip(),
-                        category=category,
-                        importance=score,
-                        speakers=speakers
-                    ))
-            
-            return key_points
-            
-        except Exception as e:
-            self.logger.error(f"Error extracting key points: {e}")
+            # Whitespace-normalized transcripts arrive as a single line
+            for sentence in _SENTENCE_END_RE.split(line):
+                words = sentence.split()
+                for start in range(0, len(words), SPACY_WINDOW_TOKENS):
+                    yield " ".join(words[start:start + SPACY_WINDOW_TOKENS])
+
+    def _split_windows(self, text: str) -> List[str]:
+        """Split text on line boundaries into windows of ~SPACY_WINDOW_TOKENS words."""
+        windows = []
+        current: List[str] = []
+        current_length = 0
+        
+        for line in self._window_lines(text):
+            length = len(line.split())
+            if not length:
+                continue
+            if current and current_length + length > SPACY_WINDOW_TOKENS:
+                windows.append("\n".join(current))
+                current, current_length = [], 0
+            current.append(line)
+            current_length += length
+        
+        if current:
+            windows.append("\n".join(current))
+        return windows
+
+    def _parse_batch(self, texts: List[str]) -> List[Doc]:
+        """Run the spaCy pipeline over all texts in batches."""
+        return list(self.nlp.pipe(texts, batch_size=SPACY_BATCH_SIZE))
+
+    def _iter_sentences(self, docs: List[Doc]) -> List[Span]:
+        """Return the non-empty sentences of the parsed transcript."""
+        return [sent for doc in docs for sent in doc.sents if sent.text.strip()]
+
+    def _extract_key_points(self, docs: List[Doc], meeting_data: Dict[str, Any]) -> List[KeyPoint]:
+        """Extract key points from the meeting transcript."""
+        key_points = []
+        
+        # Split into sentences
+        sentences = self._iter_sentences(docs)
+        
+        if not sentences:
             return []
+        
+        # Score sentences for importance
+        sentence_scores = self._score_sentences(sentences)
+        
+        # Select top sentences as key points, best first; the stable sort
+        # keeps the earliest sentences among ties at the cut-off
+        top_count = min(10, len(sentences))  # Top 10 sentences
+        top_indices = np.argsort(-sentence_scores, kind="stable")[:top_count]
+        
+        for index in top_indices:
+            score = float(sentence_scores[index])
+            if score > 0.3:  # Minimum threshold
+                sentence_text = sentences[index].text.strip()
+                category = self._categorize_sentence(sentence_text)
+                speakers = self._extract_speakers(sentence_text)
+                
+                key_points.append(KeyPoint(
+                    text=sentence_text,
+                    category=category,
+                    importance=score,
+                    speakers=speakers
+                ))
+        
+        return key_points
 
-    async def _extract_decisions(self, text: str, meeting_data: Dict[str, Any]) -> List[Decision]:
+    def _extract_decisions(self, text: str, meeting_data: Dict[str, Any]) -> List[Decision]:
         """Extract decisions made during the meeting."""
-        try:
-            decisions = []
-            
-            for pattern in self.decision_patterns:
-                matches = re.finditer(pattern, text, re.IGNORECASE)
+        decisions = []
+        seen_descriptions = set()
+        
+        for pattern in self.decision_patterns:
+            for match in pattern.finditer(text):
+                decision_text = match.group(1).strip()
                 
-                for match in matches:
-                    decision_text = match.group(1).strip()
-                    
-                    if len(decision_text) > 10:  # Minimum length
-                        # Get context (surrounding text)
-                        start = max(0, match.start() - 100)
-                        end = min(len(text), match.end() + 100)
-                        context = text[start:end].strip()
-                        
-                        # Extract participants from context
-                        participants = await self._extract_speakers(context)
-                        
-                        decisions.append(Decision(
-                            description=decision_text,
-                            context=context,
-                            participants=participants,
-                            confidence=0.8
-                        ))
-            
-            # Remove duplicates
-            unique_decisions = []
-            seen_descriptions = set()
-            
-            for decision in decisions:
-                if decision.description not in seen_descriptions:
-                    unique_decisions.append(decision)
-                    seen_descriptions.add(decision.description)
-            
-            return unique_decisions[:5]  # Limit to top 5
-            
-        except Exception as e:
-            self.logger.error(f"Error extracting decisions: {e}")
-            return []
+                # Minimum length, and skip duplicates before doing any work
+                if len(decision_text) <= 10 or decision_text in seen_descriptions:
+                    continue
+                seen_descriptions.add(decision_text)
+                
+                # Get context (surrounding text)
+                start = max(0, match.start() - 100)
+                end = min(len(text), match.end() + 100)
+                context = text[start:end].strip()
+                
+                # Extract participants from context
+                participants = self._extract_speakers(context)
+                
+                decisions.append(Decision(
+                    description=decision_text,
+                    context=context,
+                    participants=participants,
+                    confidence=0.8
+                ))
+                
+                if len(decisions) >= 5:  # Limit to top 5
+                    return decisions
+        
+        return decisions
 
-    async def _extract_action_items(self, text: str, meeting_data: Dict[str, Any]) -> List[ActionItem]:
+    def _extract_action_items(self, text: str, meeting_data: Dict[str, Any]) -> List[ActionItem]:
         """Extract action items from the meeting transcript."""
-        try:
-            action_items = []
-            
-            for pattern in self.action_patterns:
-                matches = re.finditer(pattern, text, re.IGNORECASE)
+        action_items = []
+        seen_descriptions = set()
+        
+        for pattern in self.action_patterns:
+            for match in pattern.finditer(text):
+                action_text = match.group(1).strip()
                 
-                for match in matches:
-                    action_text = match.group(1).strip()
-                    
-                    if len(action_text) > 5:  # Minimum length
-                        # Extract assigned person
-                        assigned_to = await self._extract_assignee(action_text, text)
-                        
-                        # Extract due date
-                        due_date = await self._extract_due_date(action_text)
-                        
-                        # Determine priority
-                        priority = await self._determine_priority(action_text)
-                        
-                        # Categorize action item
-                        category = await self._categorize_action_item(action_text)
-                        
-                        action_items.append(ActionItem(
-                            description=action_text,
-                            assigned_to=assigned_to,
-                            due_date=due_date,
-                            priority=priority,
-                            category=category,
-                            confidence=0.7
-                        ))
-            
-            # Remove duplicates
-            unique_actions = []
-            seen_descriptions = set()
-            
-            for action in action_items:
-                if action.description not in seen_descriptions:
-                    unique_actions.append(action)
-                    seen_descriptions.add(action.description)
-            
-            return unique_actions[:10]  # Limit to top 10
-            
-        except Exception as e:
-            self.logger.error(f"Error extracting action items: {e}")
-            return []
+                # Minimum length, and skip duplicates before doing any work
+                if len(action_text) <= 5 or action_text in seen_descriptions:
+                    continue
+                seen_descriptions.add(action_text)
+                
+                # Extract assigned person
+                assigned_to = self._extract_assignee(action_text, text)
+                
+                # Extract due date
+                due_date = self._extract_due_date(action_text)
+                
+                # Determine priority
+                priority = self._determine_priority(action_text)
+                
+                # Categorize action item
+                category = self._categorize_action_item(action_text)
+                
+                action_items.append(ActionItem(
+                    description=action_text,
+                    assigned_to=assigned_to,
+                    due_date=due_date,
+                    priority=priority,
+                    category=category,
+                    confidence=0.7
+                ))
+                
+                if len(action_items) >= 10:  # Limit to top 10
+                    return action_items
+        
+        return action_items
 
-    async def _analyze_topics(self, text: str, meeting_data: Dict[str, Any]) -> List[TopicAnalysis]:
+    def _analyze_topics(self, docs: List[Doc], meeting_data: Dict[str, Any]) -> List[TopicAnalysis]:
         """Analyze topics discussed in the meeting."""
-        try:
-            # Use TF-IDF to extract keywords
-            sentences = sent_tokenize(text)
-            
-            if len(sentences) < 3:
-                return []
-            
-            # Vectorize sentences
-            vectorizer = TfidfVectorizer(
-                max_features=100,
-                stop_words='english',
-                ngram_range=(1, 2)
+        # Use TF-IDF to extract keywords
+        sentence_spans = self._iter_sentences(docs)
+        sentences = [sent.text.strip() for sent in sentence_spans]
+        
+        if len(sentences) < 3:
+            return []
+        
+        # Vectorize sentences
+        vectorizer = TfidfVectorizer(
+            max_features=100,
+            stop_words='english',
+            ngram_range=(1, 2),
+            dtype=np.float32
+        )
+        
+        tfidf_matrix = vectorizer.fit_transform(sentences)
+        feature_names = vectorizer.get_feature_names_out()
+        
+        # Cluster sentences into topics
+        n_topics = min(5, len(sentences) // 3)  # Max 5 topics
+        if n_topics < 2:
+            n_topics = 2
+        
+        # A single seeded run is plenty for a 2-5 cluster heuristic split
+        if len(sentences) > TOPIC_MINIBATCH_MIN_SENTENCES:
+            kmeans = MiniBatchKMeans(
+                n_clusters=n_topics,
+                batch_size=128,
+                n_init=1,
+                max_iter=50,
+                random_state=42
             )
+        else:
+            kmeans = KMeans(
+                n_clusters=n_topics,
+                n_init=1,
+                max_iter=50,
+                random_state=42,
+                algorithm='elkan'
+            )
+        clusters = kmeans.fit_predict(tfidf_matrix)
+        
+        # Find the speakers of every sentence in one scan per doc
+        sentence_speakers = self._speakers_by_sentence(sentence_spans)
+        
+        # Scan each sentence for sentiment words once, for all clusters
+        sentiment_masks = np.fromiter(
+            (_sentiment_mask(sentence) for sentence in sentences),
+            dtype=np.int64,
+            count=len(sentences)
+        )
+        
+        topics = []
+        
+        for cluster_id in range(n_topics):
+            # Get sentences in this cluster
+            cluster_sentences = [
+                sentences[i] for i, c in enumerate(clusters) if c == cluster_id
+            ]
             
-            tfidf_matrix = vectorizer.fit_transform(sentences)
-            feature_names = vectorizer.get_feature_names_out()
+            if not cluster_sentences:
+                continue
             
-            # Cluster sentences into topics
-            n_topics = min(5, len(sentences) // 3)  # Max 5 topics
-            if n_topics < 2:
-                n_topics = 2
+            # Get top keywords for this cluster
+            cluster_center = kmeans.cluster_centers_[cluster_id]
+            n_keywords = min(10, len(cluster_center))
+            top_indices = np.argpartition(cluster_center, -n_keywords)[-n_keywords:]
+            top_indices = top_indices[np.argsort(cluster_center[top_indices])[::-1]]
+            keywords = [feature_names[i] for i in top_indices]
             
-            kmeans = KMeans(n_clusters=n_topics, random_state=42)
-            clusters = kmeans.fit_predict(tfidf_matrix)
+            # Generate topic name from keywords
+            topic_name = self._generate_topic_name(keywords, cluster_sentences)
             
-            topics = []
+            # Collect speakers of cluster sentences
+            speakers = list(set().union(*(
+                sentence_speakers[i] for i, c in enumerate(clusters) if c == cluster_id
+            )))
             
-            for cluster_id in range(n_topics):
-                # Get sentences in this cluster
-                cluster_sentences = [
-                    sentences[i] for i, c in enumerate(clusters) if c == cluster_id
-                ]
-                
-                if not cluster_sentences:
-                    continue
-                
-                # Get top keywords for this cluster
-                cluster_center = kmeans.cluster_centers_[cluster_id]
-                top_indices = cluster_center.argsort()[-10:][::-1]
-                keywords = [feature_names[i] for i in top_indices]
-                
-                # Generate topic name from keywords
-                topic_name = await self._generate_topic_name(keywords, cluster_sentences)
-                
-                # Extract speakers from cluster sentences
-                speakers = []
-                for sentence in cluster_sentences:
-                    sentence_speakers = await self._extract_speakers(sentence)
-                    speakers.extend(sentence_speakers)
-                speakers = list(set(speakers))  # Remove duplicates
-                
-                # Calculate duration (rough estimate)
-                duration = len(cluster_sentences) * 0.5  # Assume 30 seconds per sentence
-                
-                # Analyze sentiment
-                sentiment = await self._analyze_cluster_sentiment(cluster_sentences)
-                
-                topics.append(TopicAnalysis(
-                    topic=topic_name,
-                    keywords=keywords[:5],
-                    duration=duration,
-                    participants=speakers,
-                    sentiment=sentiment,
-                    importance=len(cluster_sentences) / len(sentences)
-                ))
+            # Calculate duration (rough estimate)
+            duration = len(cluster_sentences) * 0.5  # Assume 30 seconds per sentence
             
-            return sorted(topics, key=lambda x: x.importance, reverse=True)
+            # Analyze sentiment
+            sentiment = self._analyze_cluster_sentiment(sentiment_masks[clusters == cluster_id])
             
-        except Exception as e:
-            self.logger.error(f"Error analyzing topics: {e}")
-            return []
+            topics.append(TopicAnalysis(
+                topic=topic_name,
+                keywords=keywords[:5],
+                duration=duration,
+                participants=speakers,
+                sentiment=sentiment,
+                importance=len(cluster_sentences) / len(sentences)
+            ))
+        
+        return sorted(topics, key=lambda x: x.importance, reverse=True)
 
-    async def _score_sentences(self, sentences: List[str]) -> List[float]:
+    def _score_sentences(self, sentences: List[Span]) -> np.ndarray:
         """Score sentences for importance."""
-        scores = []
+        n = len(sentences)
+        scores = np.empty(n, dtype=np.float64)
+        first_cut = n * 0.1
+        last_cut = n * 0.9
         
-        for sentence in sentences:
+        for idx, sentence in enumerate(sentences):
             score = 0.0
             
             # Length score (prefer medium-length sentences)
-            word_count = len(word_tokenize(sentence))
+            word_count = sum(1 for token in sentence if not token.is_space)
             if 10 <= word_count <= 30:
                 score += 0.2
             
-            # Keyword score (look for important words)
-            important_words = [
-                'decision', 'action', 'important', 'critical', 'urgent',
-                'deadline', 'priority', 'goal', 'objective', 'result'
-            ]
-            for word in important_words:
-                if word in sentence.lower():
-                    score += 0.1
+            # Keyword score (look for important words among the tokens
+            # spaCy already produced, instead of rescanning the text)
+            tokens = {token.lower_ for token in sentence}
+            score += 0.1 * len(tokens & self.important_words)
             
             # Position score (first and last sentences often important)
-            if sentences.index(sentence) < len(sentences) * 0.1:
+            if idx < first_cut:
                 score += 0.1
-            if sentences.index(sentence) > len(sentences) * 0.9:
+            if idx > last_cut:
                 score += 0.1
             
-            scores.append(min(score, 1.0))
+            scores[idx] = min(score, 1.0)
         
         return scores
 
-    async def _categorize_sentence(self, sentence: str) -> str:
+    def _categorize_sentence(self, sentence: str) -> str:
         """Categorize a sentence."""
-        sentence_lower = sentence.lower()
-        
-        if any(word in sentence_lower for word in ['?', 'what', 'how', 'why', 'when', 'where']):
-            return 'question'
-        elif any(word in sentence_lower for word in ['decision', 'decided', 'agreed']):
-            return 'decision'
-        elif any(word in sentence_lower for word in ['action', 'will', 'should', 'need to']):
-            return 'action'
-        elif any(word in sentence_lower for word in ['announce', 'announcement', 'news']):
-            return 'announcement'
-        else:
-            return 'discussion'
+        return _classify(sentence.lower(), _SENTENCE_CATEGORIES, 'discussion')
+
+    def _speakers_by_sentence(self, sentences: List[Span]) -> List[Set[str]]:
+        """Map each sentence to the "Name:" speakers inside it."""
+        # One regex pass over each doc; sentences then look up the matches
+        # falling inside their character span by bisecting match offsets
+        doc_matches: Dict[int, Tuple[List[int], List[int], List[str]]] = {}
+        speakers = []
+        
+        for sentence in sentences:
+            matches = doc_matches.get(id(sentence.doc))
+            if matches is None:
+                found = list(_SPEAKER_RE.finditer(sentence.doc.text))
+                matches = (
+                    [match.start() for match in found],
+                    [match.end() for match in found],
+                    [match.group(1) for match in found],
+                )
+                doc_matches[id(sentence.doc)] = matches
+            
+            starts, ends, names = matches
+            first = bisect.bisect_left(starts, sentence.start_char)
+            last = bisect.bisect_left(starts, sentence.end_char)
+            speakers.append({
+                names[i] for i in range(first, last) if ends[i] <= sentence.end_char
+            })
+        
+        return speakers
 
-    async def _extract_speakers(self, text: str) -> List[str]:
+    def _extract_speakers(self, text: str) -> List[str]:
         """Extract speaker names from text."""
         # Simple pattern matching for "Name:" format
-        speaker_pattern = r'([A-Z][a-z]+):'
-        matches = re.findall(speaker_pattern, text)
-        return list(set(matches))
+        return list(set(_SPEAKER_RE.findall(text)))
 
-    async def _extract_assignee(self, action_text: str, full_text: str) -> Optional[str]:
+    def _extract_assignee(self, action_text: str, full_text: str) -> Optional[str]:
         """Extract who is assigned to an action item."""
-        # Look for patterns like "Sarah will", "@Sarah", "assigned to Sarah"
-        patterns = [
-            r'([A-Z][a-z]+)\s+will',
-            r'@([A-Z][a-z]+)',
-            r'assigned to ([A-Z][a-z]+)',
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, action_text, re.IGNORECASE)
+        for pattern in _ASSIGNEE_PATTERNS:
+            match = pattern.search(action_text)
             if match:
                 return match.group(1)
         
         return None
 
-    async def _extract_due_date(self, action_text: str) -> Optional[str]:
+    def _extract_due_date(self, action_text: str) -> Optional[str]:
         """Extract due date from action item."""
-        date_patterns = [
-            r'by (\w+day)',
-            r'by (\w+ \d{1,2})',
-            r'(\d{1,2}/\d{1,2})',
-            r'(\d{1,2}-\d{1,2})',
-        ]
-        
-        for pattern in date_patterns:
-            match = re.search(pattern, action_text, re.IGNORECASE)
+        for pattern in _DUE_DATE_PATTERNS:
+            match = pattern.search(action_text)
             if match:
                 return match.group(1)
         
         return None
 
-    async def _determine_priority(self, action_text: str) -> str:
+    def _determine_priority(self, action_text: str) -> str:
         """Determine priority of action item."""
-        text_lower = action_text.lower()
-        
-        if any(word in text_lower for word in ['urgent', 'asap', 'immediately', 'critical']):
-            return 'high'
-        elif any(word in text_lower for word in ['important', 'priority', 'soon']):
-            return 'medium'
-        else:
-            return 'low'
+        return _classify(action_text.lower(), _ACTION_PRIORITIES, 'low')
 
-    async def _categorize_action_item(self, action_text: str) -> Optional[str]:
+    def _categorize_action_item(self, action_text: str) -> Optional[str]:
         """Categorize an action item."""
-        text_lower = action_text.lower()
-        
-        if any(word in text_lower for word in ['document', 'write', 'create', 'draft']):
-            return 'documentation'
-        elif any(word in text_lower for word in ['test', 'verify', 'check', 'validate']):
-            return 'testing'
-        elif any(word in text_lower for word in ['review', 'analyze', 'examine']):
-            return 'review'
-        elif any(word in text_lower for word in ['meeting', 'schedule', 'call']):
-            return 'meeting'
-        elif any(word in text_lower for word in ['fix', 'resolve', 'debug', 'troubleshoot']):
-            return 'bug_fix'
-        else:
-            return 'general'
+        return _classify(action_text.lower(), _ACTION_CATEGORIES, 'general')
 
-    async def _generate_topic_name(self, keywords: List[str], sentences: List[str]) -> str:
+    def _generate_topic_name(self, keywords: List[str], sentences: List[str]) -> str:
         """Generate a topic name from keywords and sentences."""
         # Simple approach: use the most common meaningful keyword
         meaningful_keywords = [
@@ -760,24 +1285,13 @@ class SummaryService:
         else:
             return "General Discussion"
 
-    async def _analyze_overall_sentiment(self, text: str) -> str:
+    def _analyze_overall_sentiment(self, text: str) -> str:
         """Analyze overall sentiment of the meeting."""
-        # Simple keyword-based sentiment analysis
-        positive_words = ['good', 'great', 'excellent', 'success', 'agree', 'happy', 'positive']
-        negative_words = ['problem', 'issue', 'concern', 'difficult', 'challenge', 'disagree']
-        
-        text_lower = text.lower()
-        positive_count = sum(1 for word in positive_words if word in text_lower)
-        negative_count = sum(1 for word in negative_words if word in text_lower)
-        
-        if positive_count > negative_count + 2:
-            return 'positive'
-        elif negative_count > positive_count + 2:
-            return 'negative'
-        else:
-            return 'neutral'
+        # Simple keyword-based sentiment analysis: count each distinct
+        # sentiment word present, found in one pass over the text
+        return _sentiment_label(_sentiment_mask(text))
 
-    async def _calculate_engagement_level(self, meeting_data: Dict[str, Any]) -> str:
+    def _calculate_engagement_level(self, meeting_data: Dict[str, Any]) -> str:
         """Calculate engagement level based on meeting metrics."""
         duration = meeting_data.get('duration', 0)
         participant_count = meeting_data.get('participant_count', 0)
@@ -790,7 +1304,7 @@ class SummaryService:
         else:
             return 'low'
 
-    async def _calculate_productivity_score(
+    def _calculate_productivity_score(
         self, 
         decisions_count: int, 
         action_items_count: int, 
@@ -811,106 +1325,188 @@ class SummaryService:
         total_score = decisions_score + actions_score + points_score
         return min(total_score, 100.0)
 
-    async def _analyze_cluster_sentiment(self, sentences: List[str]) -> str:
-        """Analyze sentiment of a cluster of sentences."""
-        # Simple approach for now
-        return await self._analyze_overall_sentiment(' '.join(sentences))
+    def _analyze_cluster_sentiment(self, sentence_masks: np.ndarray) -> str:
+        """Analyze sentiment of a cluster from its sentences' sentiment masks."""
+        return _sentiment_label(int(np.bitwise_or.reduce(sentence_masks)))
 
-    async def _calculate_summary_confidence(self, text: str) -> float:
+    def _calculate_summary_confidence(self, docs: List[Doc]) -> float:
         """Calculate confidence score for the summary."""
         # Based on text length and quality
-        word_count = len(word_tokenize(text))
-        
-        if word_count < 50:
-            return 0.3
-        elif word_count < 200:
-            return 0.6
-        elif word_count < 500:
-            return 0.8
-        else:
-            return 0.9
+        word_count = sum(1 for doc in docs for token in doc if not token.is_space)
+        return _WC_SCORES[bisect.bisect_right(_WC_THRESHOLDS, word_count)]
 
-    async def _save_summary(self, summary: MeetingSummary) -> None:
-        """Save summary to database."""
+    async def _finalize_summary(self, summary: MeetingSummary) -> None:
+        """Save a summary and hand its Kafka and Redis writes to the sink."""
         try:
-            # This would integrate with your database layer
-            self.logger.info(f"Saving summary for meeting {summary.meeting_id}")
+            await self._save_summary(summary)
+        except Exception as e:
+            self.logger.error("Failed to save summary: %s", e)
+        
+        if self._sink_task is not None:
+            # Only waits when the sink is SINK_QUEUE_SIZE summaries behind
+            await self._sink_queue.put(summary)
+        else:
+            await self._flush_summaries([summary])
+
+    async def _sink_loop(self) -> None:
+        """Drain finalized summaries in batches until cancelled."""
+        queue = self._sink_queue
+        while True:
+            batch = [await queue.get()]
+            while len(batch) < SINK_BATCH_SIZE:
+                try:
+                    batch.append(queue.get_nowait())
+                except asyncio.QueueEmpty:
+                    break
             
+            try:
+                await self._flush_summaries(batch)
+            except Exception as e:
+                self.logger.error("Failed to flush summary batch: %s", e)
+            finally:
+                for _ in batch:
+                    queue.task_done()
+
+    async def _flush_summaries(self, summaries: List[MeetingSummary]) -> None:
+        """Publish and cache summaries, sending every cache write in one round-trip."""
+        # Events go out first so a Redis failure can't cost the batch its events
+        results = await asyncio.gather(
+            *(self._publish_summary_event(summary) for summary in summaries),
+            return_exceptions=True
+        )
+        for result in results:
+            if isinstance(result, BaseException):
+                self.logger.error("Failed to publish summary event: %s", result)
+        
+        # Summaries built from fallbacks are published but never cached
+        summaries = [summary for summary in summaries if summary._cacheable]
+        if not self.redis or not summaries:
+            return
+        
+        try:
+            pipe = self.redis.pipeline(transaction=False)
+            for summary in summaries:
+                await self._cache_summary(summary, pipe)
+            await pipe.execute()
+            return
         except Exception as e:
-            self.logger.error(f"Failed to save summary: {e}")
+            self.logger.error("Failed to cache summary batch, retrying per key: %s", e)
+        
+        # SETEX is idempotent, so keys the pipeline did write are safe to rewrite
+        results = await asyncio.gather(
+            *(self._cache_summary(summary) for summary in summaries),
+            return_exceptions=True
+        )
+        for result in results:
+            if isinstance(result, BaseException):
+                self.logger.error("Failed to cache summary: %s", result)
+
+    async def _save_summary(self, summary: MeetingSummary) -> None:
+        """Save summary to database."""
+        # This would integrate with your database layer
+        self.logger.info("Saving summary for meeting %s", summary.meeting_id)
 
     async def _publish_summary_event(self, summary: MeetingSummary) -> None:
         """Publish summary completion event to Kafka."""
-        try:
-            if self.kafka:
-                event_data = {
-                    "type": "summary_generated",
-                    "meeting_id": summary.meeting_id,
-                    "summary_id": f"summary_{summary.meeting_id}",
-                    "data": {
-                        "meeting_id": summary.meeting_id,
-                        "confidence": summary.confidence,
-                        "key_points_count": len(summary.key_points),
-                        "decisions_count": len(summary.decisions),
-                        "action_items_count": len(summary.action_items),
-                        "productivity_score": summary.productivity_score
-                    },
-                    "timestamp": time.time()
-                }
-                
-                await self.kafka.publish(
-                    settings.KAFKA_TOPIC_SUMMARY,
-                    json.dumps(event_data)
-                )
-                
-        except Exception as e:
-            self.logger.error(f"Failed to publish summary event: {e}")
+        if self.kafka:
+            event_data = {
+                "type": "summary_generated",
+                "meeting_id": summary.meeting_id,
+                "summary_id": self._summary_id(summary.meeting_id),
+                "data": {
+                    "confidence": summary.confidence,
+                    "key_points_count": len(summary.key_points),
+                    "decisions_count": len(summary.decisions),
+                    "action_items_count": len(summary.action_items),
+                    "productivity_score": summary.productivity_score
+                },
+                # Integer nanoseconds since the Unix epoch
+                "timestamp_ns": time.time_ns()
+            }
+            
+            await self.kafka.publish(
+                self._summary_topic,
+                orjson.dumps(event_data, option=_ORJSON_OPTIONS)
+            )
 
-    async def _cache_summary(self, summary: MeetingSummary) -> None:
-        """Cache summary in Redis."""
+    async def _get_cached_summary(self, meeting_id: str) -> Optional[MeetingSummary]:
+        """Get a previously generated summary from Redis."""
         try:
             if self.redis:
-                cache_key = f"summary:{summary.meeting_id}"
-                cache_data = asdict(summary)
-                
-                # Convert datetime to string for JSON serialization
-                cache_data['generated_at'] = summary.generated_at.isoformat()
-                
-                await self.redis.setex(
-                    cache_key,
-                    settings.CACHE_TTL_SUMMARY,
-                    json.dumps(cache_data, default=str)
-                )
-                
+                payload = await self.redis.get(self._summary_cache_key(meeting_id))
+                if payload:
+                    return MeetingSummary.from_dict(orjson.loads(_unpack_cache_payload(payload)))
+                    
         except Exception as e:
-            self.logger.error(f"Failed to cache summary: {e}")
+            self.logger.error("Failed to read cached summary: %s", e)
+        return None
 
-    async def health_check(self) -> Dict[str, Any]:
+    def _serialize_summary(self, summary: MeetingSummary) -> bytes:
+        """Encode and compress a summary once, reusing the bytes on later calls."""
+        if summary._cached_payload is None:
+            summary._cached_payload = _pack_cache_payload(
+                orjson.dumps(summary, option=_ORJSON_OPTIONS)
+            )
+        return summary._cached_payload
+
+    async def _cache_summary(self, summary: MeetingSummary, pipe: Optional[Any] = None) -> None:
+        """Cache summary in Redis, or queue it on a pipeline when one is given."""
+        payload = self._serialize_summary(summary)
+        cache_key = self._summary_cache_key(summary.meeting_id)
+        
+        if pipe is not None:
+            # Queued only; the caller executes the pipeline once per batch
+            pipe.setex(cache_key, self._cache_ttl, payload)
+        elif self.redis:
+            await self.redis.setex(cache_key, self._cache_ttl, payload)
+
+    def health_check(self) -> Dict[str, Any]:
         """Perform health check for summary service."""
-        try:
-            health_status = {
-                "status": "healthy",
-                "openai_available": self.openai_client is not None,
-                "summarization_model_loaded": self.summarization_model is not None,
-                "nlp_model_loaded": self.nlp is not None,
-                "performance_metrics": self.performance_metrics,
-                "timestamp": time.time()
-            }
-            
-            return health_status
-            
-        except Exception as e:
-            self.logger.error(f"Health check failed: {e}")
-            return {
-                "status": "unhealthy",
-                "error": str(e),
-                "timestamp": time.time()
-            }
+        # Plain attribute reads only, so there is nothing to await or fail
+        return {
+            "status": "healthy",
+            **self._static_health,
+            "performance_metrics": self.performance_metrics,
+            "timestamp_ns": time.time_ns()
+        }
 
     async def cleanup(self) -> None:
         """Cleanup resources."""
+        # Drain queued summaries first; later finalizations write inline
+        if self._sink_task is not None:
+            sink_task, self._sink_task = self._sink_task, None
+            try:
+                await self._sink_queue.join()
+            except Exception as e:
+                self.logger.error("Error draining summary sink: %s", e)
+            sink_task.cancel()
+            try:
+                await sink_task
+            except asyncio.CancelledError:
+                pass
+        
+        # Each connection is closed independently so one failure can't leak the rest
+        if self.kafka:
+            try:
+                await self.kafka.producer.flush()
+                await self.kafka.producer.stop()
+            except Exception as e:
+                self.logger.error("Error closing Kafka producer: %s", e)
+        
+        if self.redis:
+            try:
+                await self.redis.aclose()
+            except Exception as e:
+                self.logger.error("Error closing Redis pool: %s", e)
+        
         try:
+            if self.openai_client:
+                await self.openai_client.close()
+            
+            if self._model_executor:
+                self._model_executor.shutdown(wait=False, cancel_futures=True)
+            
             self.logger.info("✅ Summary service cleanup completed")
             
         except Exception as e:
-            self.logger.error(f"Error during cleanup: {e}")
\ No newline at end of file
+            self.logger.error("Error during cleanup: %s", e)
\ No newline at end of file